@@ -29,8 +29,12 @@
 import os
 import sys
 import json
+import bisect
 import time
+import pickle
 import random
+import threading
+import weakref
 import requests
 from datetime import datetime, timedelta
 from dataclasses import dataclass, field
@@ -45,6 +49,14 @@ try:
 except ImportError:
     pass
 
+# 网页抓取Session不校验证书（与原urllib实现一致），只屏蔽由此产生的 InsecureRequestWarning
+# 在模块加载时设置一次：warnings.catch_warnings 修改进程级状态，多线程下不安全
+try:
+    import urllib3
+    urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
+except ImportError:
+    pass
+
 
 # ═══════════════════════════════════════════════════════════
 # Alpha Vantage 配置与核心请求层
@@ -152,13 +164,34 @@ FRED_CALL_DELAY = 0.5
 AKSHARE_CALL_DELAY = 0.5
 YFINANCE_BATCH_DELAY = 2.0
 YFINANCE_TICKER_INFO_DELAY = 2.0
+YFINANCE_MAX_RETRIES = 3  # 限流时的最大尝试次数（含首次）
+
+# 跨进程日级磁盘缓存（同日重复运行直接复用；盘中会变的数据另设有效期）
+# 放在用户目录下（权限0700）：缓存用pickle读取，不能放在其他用户可写的共享临时目录
+# 设为空字符串可关闭
+DISK_CACHE_DIR = os.environ.get('DSM_CACHE_DIR',
+                                os.path.join(os.path.expanduser('~'), '.cache', 'value_invest_dsm'))
+
+# AkShare各接口的磁盘缓存有效期（秒）：资金流/现货盘中会变，两融/SHIBOR为日频
+AKSHARE_DISK_TTL = {
+    'stock_hsgt_fund_flow_summary_em': 6 * 3600,
+    'stock_zh_ah_spot_em': 3600,
+    'stock_margin_account_info': 24 * 3600,
+    'macro_china_shibor_all': 24 * 3600,
+}
+# 全球指数 / 外汇商品实时报价的磁盘缓存有效期（秒）
+SPOT_DISK_TTL = 300
+# Alpha Vantage 成功响应的磁盘缓存有效期（秒）：短时间内重跑不再消耗日配额
+AV_DISK_TTL = 900
+# yfinance 下载结果的磁盘缓存有效期（秒）：盘中最后一根K线仍在变化
+YF_DISK_TTL = 900
 
 
 # ═══════════════════════════════════════════════════════════
 # 数据结构
 # ═══════════════════════════════════════════════════════════
 
-@dataclass
+@dataclass(slots=True)
 class DataPoint:
     """单个数据点"""
     source: str
@@ -167,7 +200,7 @@ class DataPoint:
     unit: str = ""
     note: str = ""
 
-@dataclass
+@dataclass(slots=True)
 class MacroData:
     """宏观经济数据包"""
     fed_funds_rate: Optional[float] = None
@@ -194,7 +227,7 @@ class MacroData:
     last_updated: str = ""
     raw_data: dict = field(default_factory=dict)
 
-@dataclass
+@dataclass(slots=True)
 class ChinaMarketData:
     """中国市场数据包（AkShare）"""
     sh_index: Optional[float] = None
@@ -232,28 +265,40 @@ class DataSourceManager:
     def __init__(self, config: dict = None):
         self.config = config or {}
         self._batch_cache: Dict[str, Any] = {}          # batch_key -> DataFrame
+        self._batch_cache_lock = threading.Lock()        # 写入与子集扫描快照互斥（并行Skill下遍历不会撞上写入）
         self._info_cache: Dict[str, dict] = {}           # ticker -> info dict
         self._fred_cache: Dict[str, Any] = {}            # series_id -> value
+        self._fred_lock = threading.Lock()               # 多Skill并行时串行化FRED拉取与缓存写入
+        self._fred_full_series: Dict[str, List[Dict]] = {}  # series_id|start -> 未截取的完整序列
+        self._yf_inflight: Dict[str, Any] = {}           # 进行中的yfinance下载（同key只下载一次）
+        self._yf_inflight_lock = threading.Lock()
+        self._yf_download_lock = threading.Lock()        # yf.download 使用模块级全局状态，任意两次下载互斥
         self._akshare_cache: Dict[str, Any] = {}         # data_key -> value
         self._av_cache: Dict[str, Any] = {}              # AV专用缓存
         self._macro_data: Optional[MacroData] = None
         self._china_data: Optional[ChinaMarketData] = None
         self._fear_greed: Optional[dict] = None
+        self._global_index_cache: dict = {}
+        self._forex_commodity_cache: dict = {}
+        # 并行调用时同一实时数据源只拉取一次（两个数据源各自独立加锁，互不阻塞）
+        self._global_index_lock = threading.Lock()
+        self._forex_commodity_lock = threading.Lock()
+        self._closes_cache: Dict[Tuple[int, str], Tuple[Any, Any]] = {}  # (id(data), ticker) -> (weakref(data), closes)
         self._last_api_call: Dict[str, float] = {}
+        self._rate_lock = threading.Lock()
         self._stats = {'av_calls': 0, 'av_cache_hits': 0,
                        'yf_downloads': 0, 'yf_cache_hits': 0,
                        'fred_calls': 0, 'akshare_calls': 0,
-                       'errors': 0}
+                       'disk_cache_hits': 0, 'errors': 0}
+        self._disk_cache_pruned = False
+        self._disk_cache_trusted = None  # 缓存目录归属校验结果（None=未校验）
         self._av_rate_limited = False   # AV全局限流标记
         self._av_consecutive_limits = 0  # AV连续限流计数
         self._yf_available = None        # yfinance可用性（None=未检测, True/False）
         self._akshare_failures = {}      # AkShare失败记录
 
-        # HTTP Session
-        self._session = requests.Session()
-        self._session.headers.update({
-            'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36',
-        })
+        # HTTP Session（requests.Session 非线程安全，按线程各持一份，线程内复用连接池）
+        self._http_local = threading.local()
 
         # 预定义需要预加载的ticker分组（覆盖所有10个Skill的核心需求）
         # AV免费版限制：25次/分钟，500次/天
@@ -261,21 +306,125 @@ class DataSourceManager:
         self._preload_groups = {
             'indices': '^GSPC ^IXIC ^DJI ^VIX ^VIX9D ^HSI ^HSTECH ^RUT ^N225 ^FTSE ^GDAXI ^STOXX50E',
             'crypto': 'BTC-USD ETH-USD',
-            'macro_bonds': 'TLT IEF SHY HYG LQD UUP FXY GLD',
+            'macro_bonds': 'TLT IEF SHY HYG LQD UUP FXY FXE GLD',
             'commodities': 'USO SLV GDX CPER DBA PDBC',
             'credit': 'BKLN KRE',
             'china_etf': 'KWEB FXI MCHI EWH CNY=X',
-            'market_etf': 'SPY QQQ',
+            'market_etf': 'SPY QQQ VIXY',
         }
 
+    # ─── HTTP会话 ─────────────────────────────────────────
+    @property
+    def _session(self) -> requests.Session:
+        """API请求（AV / CoinGecko 等）使用的当前线程Session"""
+        session = getattr(self._http_local, 'api', None)
+        if session is None:
+            session = self._http_local.api = requests.Session()
+            session.headers.update({
+                'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36',
+            })
+        return session
+
+    @property
+    def _scrape_session(self) -> requests.Session:
+        """网页抓取（Google Finance / stockanalysis / 新浪）使用的当前线程Session"""
+        session = getattr(self._http_local, 'scrape', None)
+        if session is None:
+            session = self._http_local.scrape = requests.Session()
+            session.verify = False
+        return session
+
+    # ─── 网页抓取 ─────────────────────────────────────────
+    def _scrape_get(self, url: str, headers: dict, timeout: float) -> bytes:
+        """复用keep-alive连接抓取网页原始字节（不校验证书，与原urllib实现一致）"""
+        resp = self._scrape_session.get(url, headers=headers, timeout=timeout)
+        resp.raise_for_status()
+        return resp.content
+
+    # ─── 进程内价格缓存 ─────────────────────────────────
+    def _batch_cache_put(self, key: str, df: Any):
+        """写入 _batch_cache（与 download_prices 的子集扫描共用同一把锁）"""
+        with self._batch_cache_lock:
+            self._batch_cache[key] = df
+
+    # ─── 日级磁盘缓存 ─────────────────────────────────────
+    def _disk_cache_path(self, namespace: str, key: str, today: Optional[str] = None) -> str:
+        import hashlib
+        digest = hashlib.md5(key.encode('utf-8')).hexdigest()
+        today = today or datetime.now().strftime('%Y%m%d')
+        return os.path.join(DISK_CACHE_DIR, f"{namespace}_{today}_{digest}.pkl")
+
+    def _disk_cache_ready(self, create: bool = False) -> bool:
+        """缓存目录是否可用：必须归当前用户所有且其他用户不可写（pickle.load 会执行文件中的代码）"""
+        if not DISK_CACHE_DIR or self._disk_cache_trusted is False:
+            return False
+        if self._disk_cache_trusted:
+            return True
+        try:
+            if create:
+                os.makedirs(DISK_CACHE_DIR, mode=0o700, exist_ok=True)
+            st = os.stat(DISK_CACHE_DIR)
+        except OSError:
+            return False  # 目录尚未创建：本次视为未命中，写入时再创建
+        if hasattr(os, 'getuid') and (st.st_uid != os.getuid() or st.st_mode & 0o022):
+            print(f"    ⚠️ 磁盘缓存目录不属于当前用户或他人可写，已停用: {DISK_CACHE_DIR}")
+            self._disk_cache_trusted = False
+            return False
+        self._disk_cache_trusted = True
+        return True
+
+    def _disk_cache_get(self, namespace: str, key: str, max_age: Optional[float] = None) -> Any:
+        """读取当日磁盘缓存（可选 max_age 秒有效期），未命中、过期或损坏返回None"""
+        if not self._disk_cache_ready():
+            return None
+        path = self._disk_cache_path(namespace, key)
+        try:
+            if max_age is not None and time.time() - os.path.getmtime(path) > max_age:
+                return None
+            with open(path, 'rb') as f:
+                value = pickle.load(f)
+        except Exception:
+            return None
+        self._stats['disk_cache_hits'] += 1
+        return value
+
+    def _disk_cache_set(self, namespace: str, key: str, value: Any):
+        """写入当日磁盘缓存（先写临时文件再替换，首次写入时清理往日文件）"""
+        if not self._disk_cache_ready(create=True):
+            return
+        # 只取一次日期：跨零点时清理与写入使用同一天，不会删掉刚写入的文件
+        today = datetime.now().strftime('%Y%m%d')
+        try:
+            if not self._disk_cache_pruned:
+                self._disk_cache_pruned = True
+                # 只清理本缓存自己命名的文件（{namespace}_YYYYMMDD_{md5}.pkl），目录里的其他文件不动
+                import re
+                own_name = re.compile(r'^[a-z]+_(\d{8})_[0-9a-f]{32}\.pkl$')
+                for entry in os.scandir(DISK_CACHE_DIR):
+                    m = own_name.match(entry.name)
+                    if m and m.group(1) != today:
+                        os.remove(entry.path)
+            path = self._disk_cache_path(namespace, key, today)
+            tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+            with open(tmp_path, 'wb') as f:
+                pickle.dump(value, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, path)
+        except Exception:
+            pass
+
     # ─── 限流控制 ─────────────────────────────────────────
     def _rate_limit(self, api_name: str, min_interval: float):
-        """确保API调用间隔不小于min_interval秒"""
-        last = self._last_api_call.get(api_name, 0)
-        elapsed = time.time() - last
-        if elapsed < min_interval:
-            time.sleep(min_interval - elapsed)
-        self._last_api_call[api_name] = time.time()
+        """确保API调用间隔不小于min_interval秒
+
+        多线程并行时各调用在锁内预约下一个时间槽、锁外等待，
+        同一API严格按间隔排队，不同API之间互不阻塞
+        """
+        with self._rate_lock:
+            now = time.time()
+            slot = max(now, self._last_api_call.get(api_name, 0) + min_interval)
+            self._last_api_call[api_name] = slot
+        if slot > now:
+            time.sleep(slot - now)
 
     # ─── Alpha Vantage 核心请求 ───────────────────────────
 
@@ -294,6 +443,10 @@ class DataSourceManager:
         if cache_key in self._av_cache:
             self._stats['av_cache_hits'] += 1
             return self._av_cache[cache_key]
+        cached = self._disk_cache_get('av', cache_key, max_age=AV_DISK_TTL)
+        if cached is not None:
+            self._av_cache[cache_key] = cached
+            return cached
 
         self._rate_limit('alpha_vantage', AV_CALL_DELAY)
 
@@ -336,6 +489,7 @@ class DataSourceManager:
                 # 成功获取数据，重置连续限流计数
                 self._av_consecutive_limits = 0
                 self._av_cache[cache_key] = data
+                self._disk_cache_set('av', cache_key, data)
                 self._stats['av_calls'] += 1
                 return data
 
@@ -542,7 +696,9 @@ class DataSourceManager:
 
         # 子集缓存命中
         ticker_set = set(ticker_list)
-        for cached_key, cached_data in self._batch_cache.items():
+        with self._batch_cache_lock:
+            cache_items = list(self._batch_cache.items())
+        for cached_key, cached_data in cache_items:
             cached_parts = cached_key.rsplit('|', 2)
             if len(cached_parts) == 3 and cached_parts[1] == period and cached_parts[2] == interval:
                 cached_tickers = set(cached_parts[0].split('|'))
@@ -556,13 +712,13 @@ class DataSourceManager:
                                     t = ticker_list[0]
                                     if t in available:
                                         subset = cached_data.xs(t, level=1, axis=1)
-                                        self._batch_cache[batch_key] = subset
+                                        self._batch_cache_put(batch_key, subset)
                                         self._stats['av_cache_hits'] += 1
                                         return subset
                                 else:
                                     subset = cached_data.loc[:, cached_data.columns.get_level_values(1).isin(found)]
                                     if not subset.empty:
-                                        self._batch_cache[batch_key] = subset
+                                        self._batch_cache_put(batch_key, subset)
                                         self._stats['av_cache_hits'] += 1
                                         return subset
                         else:
@@ -611,7 +767,7 @@ class DataSourceManager:
                 if period_days > 0 and len(df) > period_days:
                     df = df.iloc[-period_days:]
                 all_dfs[ticker] = df
-                self._batch_cache[single_key] = df
+                self._batch_cache_put(single_key, df)
             else:
                 av_failed_tickers.append(ticker)
 
@@ -629,11 +785,11 @@ class DataSourceManager:
                                 if t in yf_result.columns.get_level_values(1):
                                     single_df = yf_result.xs(t, level=1, axis=1)
                                     all_dfs[t] = single_df
-                                    self._batch_cache[f"{t}|single"] = single_df
+                                    self._batch_cache_put(f"{t}|single", single_df)
                                     still_failed.remove(t) if t in still_failed else None
                             else:
                                 all_dfs[t] = yf_result
-                                self._batch_cache[f"{t}|single"] = yf_result
+                                self._batch_cache_put(f"{t}|single", yf_result)
                                 still_failed.remove(t) if t in still_failed else None
                         except Exception:
                             pass
@@ -644,7 +800,7 @@ class DataSourceManager:
             for t, df in ak_results.items():
                 if df is not None and not df.empty:
                     all_dfs[t] = df
-                    self._batch_cache[f"{t}|single"] = df
+                    self._batch_cache_put(f"{t}|single", df)
 
         if not all_dfs:
             return None
@@ -658,7 +814,7 @@ class DataSourceManager:
             result = self._merge_to_multiindex(all_dfs)
 
         if result is not None and not result.empty:
-            self._batch_cache[batch_key] = result
+            self._batch_cache_put(batch_key, result)
         return result
 
     def _merge_to_multiindex(self, dfs: Dict[str, Any]) -> Any:
@@ -705,33 +861,97 @@ class DataSourceManager:
 
     def _yfinance_fallback(self, tickers: list, period: str, interval: str) -> Any:
         """yfinance降级获取数据（含可用性短路）"""
+        disk_key = f"{'|'.join(sorted(tickers))}|{period}|{interval}"
+        cached = self._disk_cache_get('yf', disk_key, max_age=YF_DISK_TTL)
+        if cached is not None:
+            return cached
         # 已探测到yfinance不可用时直接跳过
         if self._yf_available is False:
             return None
-        try:
-            import yfinance as yf
-            ticker_str = ' '.join(tickers)
-            self._rate_limit('yfinance', YFINANCE_BATCH_DELAY)
 
-            data = yf.download(tickers=ticker_str, period=period, interval=interval,
-                               progress=False, threads=True, timeout=10)
-            if data is not None and not data.empty:
-                self._stats['yf_downloads'] += 1
-                if self._yf_available is None:
-                    self._yf_available = True
-                return data
+        # single-flight：并行Skill请求同一组ticker时，只有首个线程真正下载，其余等待其结果
+        from concurrent.futures import Future
+        with self._yf_inflight_lock:
+            pending = self._yf_inflight.get(disk_key)
+            if pending is None:
+                pending = self._yf_inflight[disk_key] = Future()
+                is_owner = True
             else:
-                # 返回空结果也视为不可用
-                if self._yf_available is None:
-                    self._yf_available = False
-                return None
-        except Exception as e:
-            print(f"    ⚠️ yfinance降级失败: {str(e)[:60]}")
-            self._stats['errors'] += 1
-            if self._yf_available is None:
-                self._yf_available = False
+                is_owner = False
+        if not is_owner:
+            return pending.result()
+
+        data = None
+        try:
+            data = self._yfinance_download(tickers, period, interval, disk_key)
+        finally:
+            with self._yf_inflight_lock:
+                self._yf_inflight.pop(disk_key, None)
+            pending.set_result(data)
+        return data
+
+    def _yfinance_download(self, tickers: list, period: str, interval: str, disk_key: str) -> Any:
+        """实际执行yfinance下载（由 _yfinance_fallback 保证同key不并发）
+
+        yf.download 把每次下载的结果与错误放在模块级全局状态（yf.shared）中，
+        不同ticker组合的下载也不能并发，下载及读取其错误记录均在 _yf_download_lock 内完成
+        """
+        for attempt in range(YFINANCE_MAX_RETRIES):
+            try:
+                import yfinance as yf
+                ticker_str = ' '.join(tickers)
+                self._rate_limit('yfinance', YFINANCE_BATCH_DELAY)
+
+                with self._yf_download_lock:
+                    data = yf.download(tickers=ticker_str, period=period, interval=interval,
+                                       progress=False, threads=True, timeout=10)
+                    rate_limited = (data is None or data.empty) and self._yf_download_rate_limited(yf)
+                if data is not None and not data.empty:
+                    self._stats['yf_downloads'] += 1
+                    self._disk_cache_set('yf', disk_key, data)
+                    if self._yf_available is None:
+                        self._yf_available = True
+                    return data
+                # yf.download 会吞掉单ticker异常（含限流）并返回空表，错误文案记录在 yf.shared._ERRORS
+                if not rate_limited:
+                    # 返回空结果也视为不可用
+                    if self._yf_available is None:
+                        self._yf_available = False
+                    return None
+            except Exception as e:
+                if not self._is_yf_rate_limit(e):
+                    print(f"    ⚠️ yfinance降级失败: {str(e)[:60]}")
+                    self._stats['errors'] += 1
+                    if self._yf_available is None:
+                        self._yf_available = False
+                    return None
+            # 限流属瞬时错误：指数退避+抖动后重试，不判定yfinance不可用
+            if attempt < YFINANCE_MAX_RETRIES - 1:
+                wait = 0.5 * 2 ** attempt + random.random()
+                print(f"    🚫 yfinance限流，退避{wait:.1f}秒后重试...")
+                time.sleep(wait)
+        print(f"    ⚠️ yfinance持续限流，{YFINANCE_MAX_RETRIES}次尝试后放弃")
+        self._stats['errors'] += 1
         return None
 
+    @staticmethod
+    def _is_yf_rate_limit(err: Exception) -> bool:
+        """是否为yfinance限流错误（YFRateLimitError 或 HTTP 429 文案）"""
+        if type(err).__name__ == 'YFRateLimitError':
+            return True
+        msg = str(err).lower()
+        return 'too many requests' in msg or 'rate limit' in msg
+
+    @staticmethod
+    def _yf_download_rate_limited(yf) -> bool:
+        """上一次 yf.download 记录的单ticker错误中是否含限流（空结果时判断是否值得重试）"""
+        errors = getattr(getattr(yf, 'shared', None), '_ERRORS', None)
+        if not isinstance(errors, dict):
+            return False
+        return any('ratelimit' in str(msg).lower().replace(' ', '')
+                   or 'too many requests' in str(msg).lower()
+                   for msg in errors.values())
+
     # ─── AkShare 美股降级层（第三层降级）────────────────────
 
     def _akshare_us_fallback(self, tickers: list, period: str = "3mo") -> Dict[str, Any]:
@@ -834,7 +1054,7 @@ class DataSourceManager:
         loaded = 0
         for ticker, df in results.items():
             if df is not None and not df.empty:
-                self._batch_cache[f"{ticker}|single"] = df
+                self._batch_cache_put(f"{ticker}|single", df)
                 loaded += 1
         if loaded > 0:
             print(f"    ✅ AkShare美股降级加载: {loaded}/{len(tickers)}个ticker")
@@ -1075,7 +1295,7 @@ class DataSourceManager:
         # 第三层：AkShare获取价格后构建info
         ak_results = self._akshare_us_fallback([ticker], "3mo")
         if ticker in ak_results and ak_results[ticker] is not None:
-            self._batch_cache[f"{ticker}|single"] = ak_results[ticker]
+            self._batch_cache_put(f"{ticker}|single", ak_results[ticker])
             return self._build_info_from_cache(ticker)
 
         return {}
@@ -1099,6 +1319,8 @@ class DataSourceManager:
         'COST': (500, 1500), 'XOM': (60, 200), 'NVO': (30, 250),
         'TCEHY': (25, 100), 'BABA': (40, 250), 'PDD': (50, 250), 'BRK-B': (300, 700),
     }
+    # 预先展开容忍区间（下限×0.5 ~ 上限×2），校验时只需一次dict查找
+    _PRICE_SANITY_BOUNDS = {t: (lo * 0.5, hi * 2) for t, (lo, hi) in PRICE_SANITY.items()}
 
     def _build_info_from_cache(self, ticker: str) -> dict:
         """从已缓存的价格数据构建基本ticker info（AV限流时降级用）"""
@@ -1118,13 +1340,14 @@ class DataSourceManager:
             prev_close = float(closes.iloc[-2])
 
             # 数据异常检测：价格合理性校验
-            if ticker in self.PRICE_SANITY:
-                lo, hi = self.PRICE_SANITY[ticker]
-                if price < lo * 0.5 or price > hi * 2:
+            bounds = self._PRICE_SANITY_BOUNDS.get(ticker)
+            if bounds is not None:
+                lo, hi = bounds
+                if price < lo or price > hi:
                     # 价格严重异常，尝试用5日均价修正
                     recent = closes.iloc[-5:] if len(closes) >= 5 else closes
                     median_price = float(recent.median())
-                    if lo * 0.5 <= median_price <= hi * 2:
+                    if lo <= median_price <= hi:
                         price = median_price
                         prev_close = float(closes.iloc[-6]) if len(closes) >= 6 else float(closes.iloc[-2])
 
@@ -1167,9 +1390,7 @@ class DataSourceManager:
     def _fetch_stockanalysis_fundamentals(self, ticker: str) -> dict:
         """从stockanalysis.com网页抓取基本面数据（ROE/PE/负债率等）
         作为AV和yfinance都失败时的最终降级层"""
-        import urllib.request
         import re
-        import ssl
 
         # BRK-B 在 stockanalysis 上用 brk.b
         url_ticker = ticker.lower().replace('-', '.')
@@ -1178,15 +1399,10 @@ class DataSourceManager:
             'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36',
             'Accept-Language': 'en-US,en;q=0.9',
         }
-        ctx = ssl.create_default_context()
-        ctx.check_hostname = False
-        ctx.verify_mode = ssl.CERT_NONE
 
         try:
             self._rate_limit('stockanalysis', 1.5)
-            req = urllib.request.Request(url, headers=headers)
-            with urllib.request.urlopen(req, timeout=15, context=ctx) as resp:
-                html = resp.read().decode('utf-8', errors='ignore')
+            html = self._scrape_get(url, headers, 15).decode('utf-8', errors='ignore')
 
             result = {}
 
@@ -1302,11 +1518,11 @@ class DataSourceManager:
                 if isinstance(yf_data.columns, pd.MultiIndex):
                     if t in yf_data.columns.get_level_values(1):
                         single_df = yf_data.xs(t, level=1, axis=1)
-                        self._batch_cache[f"{t}|single"] = single_df
+                        self._batch_cache_put(f"{t}|single", single_df)
                         loaded += 1
                 else:
                     if len(test_batch) == 1:
-                        self._batch_cache[f"{t}|single"] = yf_data
+                        self._batch_cache_put(f"{t}|single", yf_data)
                         loaded += 1
             except Exception:
                 pass
@@ -1322,11 +1538,11 @@ class DataSourceManager:
                         if isinstance(yf_data.columns, pd.MultiIndex):
                             if t in yf_data.columns.get_level_values(1):
                                 single_df = yf_data.xs(t, level=1, axis=1)
-                                self._batch_cache[f"{t}|single"] = single_df
+                                self._batch_cache_put(f"{t}|single", single_df)
                                 loaded += 1
                         else:
                             if len(batch) == 1:
-                                self._batch_cache[f"{t}|single"] = yf_data
+                                self._batch_cache_put(f"{t}|single", yf_data)
                                 loaded += 1
                     except Exception:
                         pass
@@ -1346,30 +1562,53 @@ class DataSourceManager:
     # ─── 数据提取辅助 ─────────────────────────────────────
 
     def get_closes(self, data, ticker: str):
-        """从批量下载结果中安全提取收盘价数组"""
-        import numpy as np
+        """从批量下载结果中安全提取收盘价数组（同一DataFrame+ticker只提取一次）"""
+        if data is None:
+            return None
+        # 按对象身份缓存：弱引用校验确保 id 未被回收复用，且不延长 DataFrame 生命周期
+        key = (id(data), ticker)
+        hit = self._closes_cache.get(key)
+        if hit is not None and hit[0]() is data:
+            return hit[1]
+        arr = self._extract_closes(data, ticker)
+        cache = self._closes_cache
+
+        def _evict(ref, key=key):
+            # DataFrame被回收时移除对应条目，已失效的收盘价数组不再常驻内存
+            if cache.get(key, (None,))[0] is ref:
+                cache.pop(key, None)
+
+        try:
+            cache[key] = (weakref.ref(data, _evict), arr)
+        except TypeError:
+            pass
+        return arr
+
+    def _extract_closes(self, data, ticker: str):
         try:
             if data is None or data.empty:
                 return None
-            if isinstance(data.columns, __import__('pandas').MultiIndex):
-                if 'Close' in data.columns.get_level_values(0):
-                    level1_vals = data['Close'].columns.tolist()
-                    if ticker in level1_vals:
-                        arr = data['Close'][ticker].dropna().values
-                    elif len(level1_vals) == 1:
-                        arr = data['Close'].iloc[:, 0].dropna().values
+            cols = data.columns
+            if isinstance(cols, __import__('pandas').MultiIndex):
+                # 直接按 (字段, ticker) 元组哈希查找，避免每次重建 level 0 / 子表
+                if ('Close', ticker) in cols:
+                    arr = data[('Close', ticker)].dropna().to_numpy()
+                else:
+                    level1_vals = [t for f, t in cols if f == 'Close']
+                    if not level1_vals:
+                        return None
+                    if len(level1_vals) == 1:
+                        arr = data[('Close', level1_vals[0])].dropna().to_numpy()
                     else:
                         # 尝试ETF代理
                         etf = INDEX_TO_ETF.get(ticker)
-                        if etf and etf in level1_vals:
-                            arr = data['Close'][etf].dropna().values
+                        if etf and ('Close', etf) in cols:
+                            arr = data[('Close', etf)].dropna().to_numpy()
                         else:
                             return None
-                else:
-                    return None
             else:
-                if 'Close' in data.columns:
-                    arr = data['Close'].dropna().values
+                if 'Close' in cols:
+                    arr = data['Close'].dropna().to_numpy()
                 else:
                     return None
             return arr if len(arr) > 0 else None
@@ -1382,18 +1621,16 @@ class DataSourceManager:
         try:
             if data is None or data.empty:
                 return None
-            if isinstance(data.columns, __import__('pandas').MultiIndex):
-                if 'Volume' in data.columns.get_level_values(0):
-                    if ticker in data['Volume'].columns:
-                        arr = data['Volume'][ticker].dropna().values
-                        return arr if len(arr) > 0 else None
-                    etf = INDEX_TO_ETF.get(ticker)
-                    if etf and etf in data['Volume'].columns:
-                        arr = data['Volume'][etf].dropna().values
+            cols = data.columns
+            if isinstance(cols, __import__('pandas').MultiIndex):
+                etf = INDEX_TO_ETF.get(ticker)
+                for key in (ticker, etf):
+                    if key and ('Volume', key) in cols:
+                        arr = data[('Volume', key)].dropna().to_numpy()
                         return arr if len(arr) > 0 else None
             else:
-                if 'Volume' in data.columns:
-                    arr = data['Volume'].dropna().values
+                if 'Volume' in cols:
+                    arr = data['Volume'].dropna().to_numpy()
                     return arr if len(arr) > 0 else None
             return None
         except Exception:
@@ -1401,7 +1638,7 @@ class DataSourceManager:
 
     # ─── 预加载（一次性批量下载，跨Skill共享）─────────────
 
-    def preload_all(self, period: str = "3mo"):
+    def preload_all(self, period: str = "3mo", extra_tickers: Optional[List[str]] = None):
         """
         预加载所有常用ticker数据（Alpha Vantage优先）
 
@@ -1409,6 +1646,8 @@ class DataSourceManager:
         - 对于AV支持的ticker逐个获取（带缓存）
         - AV不支持的（如指数^VIX9D等）走yfinance降级
         - 子集缓存让后续Skill请求直接从缓存提取
+        - extra_tickers: 各Skill额外需要的ticker并集，在此统一预取，
+          避免并行Skill各自下载、重复消耗AV配额
         """
         print("  📡 预加载全局市场数据（Alpha Vantage优先）...")
         t0 = time.time()
@@ -1424,6 +1663,10 @@ class DataSourceManager:
                     if t not in seen:
                         all_tickers_ordered.append(t)
                         seen.add(t)
+        for t in extra_tickers or []:
+            if t not in seen:
+                all_tickers_ordered.append(t)
+                seen.add(t)
 
         # 分类（保持优先级顺序）
         av_tickers = []   # AV可获取
@@ -1460,7 +1703,7 @@ class DataSourceManager:
 
             df = self._fetch_single_ticker_av(ticker)
             if df is not None and not df.empty:
-                self._batch_cache[single_key] = df
+                self._batch_cache_put(single_key, df)
                 loaded += 1
             else:
                 # AV获取失败，加入yfinance降级列表
@@ -1489,11 +1732,11 @@ class DataSourceManager:
                         if isinstance(test_result.columns, pd.MultiIndex):
                             if t in test_result.columns.get_level_values(1):
                                 single_df = test_result.xs(t, level=1, axis=1)
-                                self._batch_cache[f"{t}|single"] = single_df
+                                self._batch_cache_put(f"{t}|single", single_df)
                                 yf_loaded += 1
                         else:
                             if len(test_batch) == 1:
-                                self._batch_cache[f"{t}|single"] = test_result
+                                self._batch_cache_put(f"{t}|single", test_result)
                                 yf_loaded += 1
                     except Exception:
                         pass
@@ -1510,11 +1753,11 @@ class DataSourceManager:
                                 if isinstance(yf_data.columns, pd.MultiIndex):
                                     if t in yf_data.columns.get_level_values(1):
                                         single_df = yf_data.xs(t, level=1, axis=1)
-                                        self._batch_cache[f"{t}|single"] = single_df
+                                        self._batch_cache_put(f"{t}|single", single_df)
                                         yf_loaded += 1
                                 else:
                                     if len(batch) == 1:
-                                        self._batch_cache[f"{t}|single"] = yf_data
+                                        self._batch_cache_put(f"{t}|single", yf_data)
                                         yf_loaded += 1
                             except Exception:
                                 pass
@@ -1544,7 +1787,7 @@ class DataSourceManager:
                 for t in crypto_candidates:
                     df = self._coingecko_fallback(t, period_days)
                     if df is not None and not df.empty:
-                        self._batch_cache[f"{t}|single"] = df
+                        self._batch_cache_put(f"{t}|single", df)
                         cg_loaded += 1
                 if cg_loaded > 0:
                     print(f"    ✅ CoinGecko加载: {cg_loaded}/{len(crypto_candidates)}个ticker")
@@ -1562,7 +1805,7 @@ class DataSourceManager:
                 merged = self._merge_to_multiindex(group_dfs)
                 if merged is not None:
                     group_batch_key = f"{'|'.join(sorted(group_dfs.keys()))}|{period}|1d"
-                    self._batch_cache[group_batch_key] = merged
+                    self._batch_cache_put(group_batch_key, merged)
 
         elapsed = time.time() - t0
         print(f"  📡 预加载完成 ({elapsed:.1f}秒) | "
@@ -1582,6 +1825,38 @@ class DataSourceManager:
         if fred_cache_key in self._fred_cache:
             return self._fred_cache[fred_cache_key]
 
+        with self._fred_lock:
+            # 等锁期间其他线程可能已拉取同一序列
+            if fred_cache_key in self._fred_cache:
+                return self._fred_cache[fred_cache_key]
+            return self._fetch_fred_series_locked(series_id, observation_start, limit, fred_cache_key)
+
+    def _fetch_fred_series_locked(self, series_id: str, observation_start: Optional[str],
+                                  limit: int, fred_cache_key: str) -> Optional[List[Dict]]:
+        """实际的FRED拉取（调用方需持有 _fred_lock）
+
+        同一 (series_id, observation_start) 的完整序列只拉取一次，
+        不同 limit 的请求（如 fetch_fred_latest 与 limit=10）从中截取
+        """
+        full_key = f"{series_id}|{observation_start or ''}"
+        full = self._fred_full_series.get(full_key)
+        if full is None:
+            full = self._disk_cache_get('fred', full_key)
+            if full is not None:
+                self._fred_full_series[full_key] = full
+        if full is None:
+            full = self._pull_fred_series(series_id, observation_start)
+            if full is None:
+                return None
+            self._fred_full_series[full_key] = full
+            self._disk_cache_set('fred', full_key, full)
+
+        result = full[-limit:] if len(full) > limit else full
+        self._fred_cache[fred_cache_key] = result
+        return result
+
+    def _pull_fred_series(self, series_id: str, observation_start: Optional[str]) -> Optional[List[Dict]]:
+        """请求FRED并转为 [{'date', 'value'}] 列表（不截取）"""
         self._rate_limit('fred', FRED_CALL_DELAY)
 
         try:
@@ -1601,8 +1876,6 @@ class DataSourceManager:
                         'date': date.strftime('%Y-%m-%d'),
                         'value': float(value)
                     })
-                result = result[-limit:] if len(result) > limit else result
-                self._fred_cache[fred_cache_key] = result
                 self._stats['fred_calls'] += 1
                 return result
 
@@ -1674,7 +1947,8 @@ class DataSourceManager:
                       macro.unemployment, macro.fed_balance_sheet, macro.net_liquidity]
             success = sum(1 for f in fields if f is not None)
             print(f"    ✅ FRED宏观数据: {success}/{len(fields)}项获取成功")
-            macro.raw_data = {k: v for k, v in self._fred_cache.items()}
+            with self._fred_lock:
+                macro.raw_data = dict(self._fred_cache)
         else:
             print("    ⚠️ FRED_API_KEY未设置")
             macro.source = "unavailable"
@@ -1703,12 +1977,15 @@ class DataSourceManager:
         trend = []
         tga_dict = {d['date']: d['value'] for d in (tga or [])}
         rrp_dict = {d['date']: d['value'] for d in (rrp or [])}
+        # 日期字符串只解析一次，逐周查找最近值时复用
+        tga_index = self._parse_date_index(tga_dict)
+        rrp_index = self._parse_date_index(rrp_dict)
 
         for w in walcl:
             date = w['date']
             w_val = w['value']
-            t_val = tga_dict.get(date) or self._find_nearest(tga_dict, date)
-            r_val = rrp_dict.get(date) or self._find_nearest(rrp_dict, date)
+            t_val = tga_dict.get(date) or self._find_nearest(tga_dict, date, tga_index)
+            r_val = rrp_dict.get(date) or self._find_nearest(rrp_dict, date, rrp_index)
             if t_val is not None and r_val is not None:
                 w_b = w_val / 1000
                 t_b = t_val / 1000
@@ -1718,14 +1995,23 @@ class DataSourceManager:
                               'rrp': r_b, 'net_liquidity': net})
         return trend if trend else None
 
-    def _find_nearest(self, data_dict: dict, target_date: str) -> Optional[float]:
-        """在日期字典中找最接近的值"""
+    @staticmethod
+    def _parse_date_index(data_dict: dict) -> List[Tuple[datetime, str]]:
+        """把 'YYYY-MM-DD' 键解析为按日期升序的 [(datetime, 原字符串)]"""
+        return sorted((datetime.fromisoformat(d_str), d_str) for d_str in data_dict)
+
+    def _find_nearest(self, data_dict: dict, target_date: str,
+                      date_index: Optional[List[Tuple[datetime, str]]] = None) -> Optional[float]:
+        """在日期字典中找最接近的值（date_index 为预解析的键，省去逐次解析）"""
         if not data_dict:
             return None
-        target = datetime.strptime(target_date, '%Y-%m-%d')
+        if date_index is None:
+            date_index = self._parse_date_index(data_dict)
+        target = datetime.fromisoformat(target_date)
+        # 有序索引上二分定位，最近值只可能是插入点左右两侧之一（平局取较早日期）
+        pos = bisect.bisect_left(date_index, (target,))
         best_date, best_diff = None, timedelta(days=999)
-        for d_str in data_dict:
-            d = datetime.strptime(d_str, '%Y-%m-%d')
+        for d, d_str in date_index[max(pos - 1, 0):pos + 1]:
             diff = abs(d - target)
             if diff < best_diff:
                 best_diff = diff
@@ -1742,12 +2028,11 @@ class DataSourceManager:
         china = ChinaMarketData(last_updated=datetime.now().strftime('%Y-%m-%d %H:%M'))
 
         try:
-            import akshare as ak
+            import akshare  # noqa: F401  可用性检查：未安装时走下方 except ImportError，实际调用经 _akshare_call
             print("    🇨🇳 从AkShare获取中国市场数据...")
 
             try:
-                self._rate_limit('akshare', AKSHARE_CALL_DELAY)
-                flow_df = ak.stock_hsgt_fund_flow_summary_em()
+                flow_df = self._akshare_call('stock_hsgt_fund_flow_summary_em')
                 if flow_df is not None and not flow_df.empty:
                     north_rows = flow_df[flow_df['资金方向'] == '北向']
                     if not north_rows.empty:
@@ -1762,8 +2047,7 @@ class DataSourceManager:
                 print(f"      ⚠️ 沪深港通资金获取失败: {e}")
 
             try:
-                self._rate_limit('akshare', AKSHARE_CALL_DELAY)
-                ah_df = ak.stock_zh_ah_spot_em()
+                ah_df = self._akshare_call('stock_zh_ah_spot_em')
                 if ah_df is not None and not ah_df.empty and '溢价' in ah_df.columns:
                     avg_premium = ah_df['溢价'].mean()
                     china.ah_premium_index = 100 + avg_premium
@@ -1772,8 +2056,7 @@ class DataSourceManager:
                 print(f"      ⚠️ AH溢价指数获取失败: {e}")
 
             try:
-                self._rate_limit('akshare', AKSHARE_CALL_DELAY)
-                margin_df = ak.stock_margin_account_info()
+                margin_df = self._akshare_call('stock_margin_account_info')
                 if margin_df is not None and not margin_df.empty:
                     latest = margin_df.iloc[-1]
                     for col in margin_df.columns:
@@ -1785,8 +2068,7 @@ class DataSourceManager:
                 print(f"      ⚠️ 融资融券数据获取失败: {e}")
 
             try:
-                self._rate_limit('akshare', AKSHARE_CALL_DELAY)
-                shibor_df = ak.macro_china_shibor_all()
+                shibor_df = self._akshare_call('macro_china_shibor_all')
                 if shibor_df is not None and not shibor_df.empty:
                     latest = shibor_df.iloc[-1]
                     for col in shibor_df.columns:
@@ -1825,6 +2107,20 @@ class DataSourceManager:
         self._china_data = china
         return china
 
+    def _akshare_call(self, func_name: str) -> Any:
+        """调用无参AkShare接口（按 AKSHARE_DISK_TTL 走磁盘缓存，未命中再限流请求）"""
+        ttl = AKSHARE_DISK_TTL.get(func_name)
+        if ttl:
+            cached = self._disk_cache_get('akshare', func_name, max_age=ttl)
+            if cached is not None:
+                return cached
+        import akshare as ak
+        self._rate_limit('akshare', AKSHARE_CALL_DELAY)
+        df = getattr(ak, func_name)()
+        if ttl and df is not None and not df.empty:
+            self._disk_cache_set('akshare', func_name, df)
+        return df
+
     # ─── Alpha Vantage 技术指标 ──────────────────────
 
     def fetch_av_indicator(self, symbol: str, indicator: str = 'RSI',
@@ -1866,8 +2162,19 @@ class DataSourceManager:
         获取全球主要指数的真实点位数据（非ETF代理）
         返回: {ticker: {'price': float, 'change': float, 'prev_close': float}} 
         """
-        if hasattr(self, '_global_index_cache') and self._global_index_cache:
+        if self._global_index_cache:
             return self._global_index_cache
+        with self._global_index_lock:
+            if not self._global_index_cache:
+                self._load_global_index_spot()
+        return self._global_index_cache
+
+    def _load_global_index_spot(self) -> dict:
+        """实际拉取全球指数数据并写入 _global_index_cache（调用方需持有 _global_index_lock）"""
+        cached = self._disk_cache_get('spot', 'global_index', max_age=SPOT_DISK_TTL)
+        if cached:
+            self._global_index_cache = cached
+            return cached
 
         result = {}
         try:
@@ -1910,6 +2217,8 @@ class DataSourceManager:
                     print(f"    ⚠️ Google Finance获取{gf_symbol}失败: {e}")
 
         self._global_index_cache = result
+        if result:
+            self._disk_cache_set('spot', 'global_index', result)
         return result
 
     def _fetch_google_finance_index(self, symbol: str, exchange: str) -> dict:
@@ -1917,22 +2226,14 @@ class DataSourceManager:
         从Google Finance网页抓取指数真实价格
         返回: {'price': float, 'change': float, 'prev_close': float} 或 None
         """
-        import urllib.request
         import re
-        import ssl
 
         url = f"https://www.google.com/finance/quote/{symbol}:{exchange}"
         headers = {
             'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36',
             'Accept-Language': 'en-US,en;q=0.9',
         }
-        ctx = ssl.create_default_context()
-        ctx.check_hostname = False
-        ctx.verify_mode = ssl.CERT_NONE
-
-        req = urllib.request.Request(url, headers=headers)
-        with urllib.request.urlopen(req, timeout=10, context=ctx) as resp:
-            html = resp.read().decode('utf-8', errors='ignore')
+        html = self._scrape_get(url, headers, 10).decode('utf-8', errors='ignore')
 
         price = None
         prev_close = None
@@ -1987,26 +2288,19 @@ class DataSourceManager:
         Returns:
             {symbol: {'price': float, 'change': float, 'prev_close': float, 'name': str}}
         """
-        import urllib.request
-        import ssl
         import re
 
         if not symbols:
             return {}
 
-        ctx = ssl.create_default_context()
-        ctx.check_hostname = False
-        ctx.verify_mode = ssl.CERT_NONE
-
         result = {}
         try:
             symbols_str = ','.join(symbols)
             url = f'https://hq.sinajs.cn/list={symbols_str}'
-            req = urllib.request.Request(url, headers={
+            resp = self._scrape_get(url, {
                 'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7)',
                 'Referer': 'https://finance.sina.com.cn/',
-            })
-            resp = urllib.request.urlopen(req, context=ctx, timeout=10).read().decode('gbk', errors='ignore')
+            }, 10).decode('gbk', errors='ignore')
 
             for line in resp.strip().split('\n'):
                 m = re.match(r'var hq_str_(\w+)="(.*)";', line)
@@ -2050,8 +2344,19 @@ class DataSourceManager:
             {etf_ticker: {'price': float, 'change': float, 'name': str, 'unit': str}}
             例如: {'UUP': {'price': 97.61, 'change': -0.09, 'name': '美元指数', 'unit': ''}}
         """
-        if hasattr(self, '_forex_commodity_cache') and self._forex_commodity_cache:
+        if self._forex_commodity_cache:
             return self._forex_commodity_cache
+        with self._forex_commodity_lock:
+            if not self._forex_commodity_cache:
+                self._load_forex_commodity_realtime()
+        return self._forex_commodity_cache
+
+    def _load_forex_commodity_realtime(self) -> dict:
+        """实际拉取外汇/商品数据并写入 _forex_commodity_cache（调用方需持有 _forex_commodity_lock）"""
+        cached = self._disk_cache_get('spot', 'forex_commodity', max_age=SPOT_DISK_TTL)
+        if cached:
+            self._forex_commodity_cache = cached
+            return cached
 
         # 收集需要查询的新浪符号
         sina_symbols = []
@@ -2076,6 +2381,8 @@ class DataSourceManager:
         if result:
             print(f"    ✅ 新浪外汇/商品实时数据: {len(result)}/{len(self.SINA_REALTIME_MAP)}个")
         self._forex_commodity_cache = result
+        if result:
+            self._disk_cache_set('spot', 'forex_commodity', result)
         return result
 
     # ─── Fear & Greed Index ────────────────────────────
@@ -2117,37 +2424,51 @@ class DataSourceManager:
 
     @staticmethod
     def calc_ma(prices, period: int) -> float:
-        if prices is None or len(prices) < period:
-            return float(prices[-1]) if prices is not None and len(prices) > 0 else 0
-        return sum(float(p) for p in prices[-period:]) / period
+        import numpy as np
+        if prices is None or len(prices) == 0:
+            return 0
+        # 直接接受 ndarray / Series / list，无需调用方先 .tolist()
+        arr = np.asarray(prices, dtype=np.float64)
+        if len(arr) < period:
+            return float(arr[-1])
+        return float(arr[-period:].mean())
 
     @staticmethod
     def calc_ema(prices, period: int) -> float:
         import numpy as np
-        if prices is None or len(prices) < period:
-            return float(prices[-1]) if prices is not None and len(prices) > 0 else 0
+        if prices is None or len(prices) == 0:
+            return 0
+        # 先转为ndarray再按位置取值：日期索引的Series上 prices[-1] 会按标签查找
+        arr = np.asarray(prices, dtype=float)
+        if len(arr) < period:
+            return float(arr[-1])
         multiplier = 2 / (period + 1)
-        ema = float(prices[0])
-        for p in prices[1:]:
-            ema = (float(p) - ema) * multiplier + ema
+        # 一次性转为float列表，递推循环内不再逐个float()
+        values = arr.tolist()
+        ema = values[0]
+        for p in values[1:]:
+            ema = (p - ema) * multiplier + ema
         return ema
 
     @staticmethod
     def calc_macd(prices, fast: int = 12, slow: int = 26, signal: int = 9) -> Tuple[float, float, float]:
+        import numpy as np
         if prices is None or len(prices) < slow + signal:
             return 0.0, 0.0, 0.0
 
         def _ema(data, period):
             multiplier = 2 / (period + 1)
-            ema_val = float(data[0])
+            ema_val = data[0]
             ema_arr = [ema_val]
             for p in data[1:]:
-                ema_val = (float(p) - ema_val) * multiplier + ema_val
+                ema_val = (p - ema_val) * multiplier + ema_val
                 ema_arr.append(ema_val)
             return ema_arr
 
-        ema_fast = _ema(prices, fast)
-        ema_slow = _ema(prices, slow)
+        # 快慢线共用同一份float列表，递推循环内不再逐个float()
+        values = np.asarray(prices, dtype=float).tolist()
+        ema_fast = _ema(values, fast)
+        ema_slow = _ema(values, slow)
         macd_line = [f - s for f, s in zip(ema_fast, ema_slow)]
         signal_line = _ema(macd_line, signal)
         histogram = macd_line[-1] - signal_line[-1]
@@ -2231,6 +2552,7 @@ class DataSourceManager:
             print(f"  🚫 AV全局限流已触发（连续{stats['av_consecutive_limits']}次）")
         print(f"  yfinance降级调用: {stats['yf_downloads']}次")
         print(f"  FRED调用: {stats['fred_calls']}次")
+        print(f"  日级磁盘缓存命中: {stats['disk_cache_hits']}次")
         print(f"  AkShare调用: {stats['akshare_calls']}次")
         print(f"  错误总数: {stats['errors']}次")
         print(f"  缓存大小: batch={stats['cache_size']['batch_cache']} "
@@ -2249,16 +2571,20 @@ class DataSourceManager:
 # ═══════════════════════════════════════════════════════════
 
 _global_manager: Optional[DataSourceManager] = None
+_manager_lock = threading.Lock()
 
 def get_manager(config: dict = None) -> DataSourceManager:
     global _global_manager
     if _global_manager is None:
-        _global_manager = DataSourceManager(config)
+        with _manager_lock:
+            if _global_manager is None:
+                _global_manager = DataSourceManager(config)
     return _global_manager
 
 def reset_manager():
     global _global_manager
-    _global_manager = None
+    with _manager_lock:
+        _global_manager = None
 
 
 # ═══════════════════════════════════════════════════════════
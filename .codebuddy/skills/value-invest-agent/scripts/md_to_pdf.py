@@ -13,6 +13,7 @@ Markdown → PDF 转换器 (v13.0)
 4. 生成后必须验证：字体嵌入为STHeiti（非PingFang SC）+中文可提取+Mac Preview无乱码
 """
 
+import io
 import sys
 import os
 import re
@@ -400,11 +401,11 @@ def md_to_pdf(md_path: str, output_path: str = None):
 <head><meta charset="UTF-8"><style>{probe_css}</style></head>
 <body>{html_body}</body></html>"""
     
-    probe_path = output_path + ".probe.pdf"
-    HTML(string=probe_html, base_url=base_dir).write_pdf(probe_path)
+    # probe只用于测量，直接渲染到内存，不落盘
+    probe_pdf = HTML(string=probe_html, base_url=base_dir).write_pdf()
     
     # 用 pdfplumber 精确测量内容底边
-    with pdfplumber.open(probe_path) as plumb:
+    with pdfplumber.open(io.BytesIO(probe_pdf)) as plumb:
         p = plumb.pages[0]
         page_height_pt = float(p.height)
         
@@ -419,9 +420,7 @@ def md_to_pdf(md_path: str, output_path: str = None):
             max_content_bottom = max(max_content_bottom, max(l['bottom'] for l in p.lines))
         if p.images:
             max_content_bottom = max(max_content_bottom, max(img['bottom'] for img in p.images))
-    
-    # 清理probe文件
-    os.remove(probe_path)
+    del probe_pdf  # 第2轮渲染前释放probe字节
     
     # 计算精确页面高度（内容高度 + 底部边距 + 安全余量）
     if max_content_bottom > 0:
@@ -11,6 +11,7 @@ from reportlab.lib.colors import HexColor
 from reportlab.pdfbase import pdfmetrics
 from reportlab.pdfbase.ttfonts import TTFont
 from datetime import datetime
+import io
 import os
 
 # 注册中文字体（STHeiti：中英文混排效果优秀，英文字符间距更自然）
@@ -32,6 +33,12 @@ GRAY_LIGHT = HexColor('#8d99ae')
 BG = HexColor('#edf2f4')
 WHITE = HexColor('#ffffff')
 
+# 优先级 / Tier 标签配色与文案（游戏竞品监控卡片共用）
+PRIORITY_COLORS = {'high': CORAL, 'medium': ORANGE, 'low': GRAY_LIGHT}
+TIER_COLORS = {'T0': CORAL, 'T1': ORANGE, 'T2': GRAY_LIGHT}
+PRIORITY_LABELS_SHORT = {'high': '高', 'medium': '中', 'low': '低'}
+PRIORITY_LABELS = {'high': '高优先级', 'medium': '中优先级', 'low': '低优先级'}
+
 # 页面设置
 W = 210 * mm
 M = 18 * mm
@@ -47,7 +54,9 @@ class MBBReportEngine:
         self.subtitle = subtitle
         self.accent = accent_color
         self.H = 297 * mm * page_scale
-        self.c = canvas.Canvas(filename, pagesize=(W, self.H))
+        # 先渲染到内存，save() 时裁剪后一次性写盘
+        self._buf = io.BytesIO()
+        self.c = canvas.Canvas(self._buf, pagesize=(W, self.H))
         self.y = self.H - M
 
     def text(self, x, y, text, font, size, color):
@@ -174,6 +183,9 @@ class MBBReportEngine:
         """
         items = [(label, value, change, change_color), ...]
         """
+        if not items:
+            return
+
         card_h = 25 + len(items) * 22 + 10
         self.c.setFillColor(BG)
         self.c.roundRect(M, self.y - card_h, CW, card_h, 6, fill=1, stroke=0)
@@ -199,40 +211,68 @@ class MBBReportEngine:
         """
         events = [(time_str, title, source, detail, color), ...]
         """
+        if not events:
+            return
+        self.draw_timeline_columns(*[list(col) for col in zip(*events)])
+
+    def draw_timeline_columns(self, times, titles, sources, details, colors):
+        """
+        列式时间线：times/titles/sources/details/colors 为等长列表
+        先一次性完成换行与布局，再逐列绘制（同列字体/颜色只设置一次）
+        """
+        if not times:
+            return
+
         timeline_x = M + 25
+        text_x = timeline_x + 15
         text_max_w = W - M - timeline_x - 25
+
+        # 布局：计算标题和详情的换行，以及每条事件的起始位置和高度
+        title_lines = [self.wrap_text(t, text_max_w, FONT_BOLD, 10) for t in titles]
+        detail_lines = [self.wrap_text(d, text_max_w, FONT, 8) for d in details]
+        y_pos, heights = [], []
         y_offset = 0
-        for i, (time, event, source, detail, color) in enumerate(events):
-            # 计算标题和详情的换行
-            title_lines = self.wrap_text(event, text_max_w, FONT_BOLD, 10)
-            detail_lines = self.wrap_text(detail, text_max_w, FONT, 8)
-            # 每条事件所需高度
-            item_h = 18 + len(title_lines) * 14 + len(detail_lines) * 11 + 14
-
-            y_pos = self.y - y_offset
-            self.c.setFillColor(color)
-            self.c.circle(timeline_x, y_pos, 5, fill=1, stroke=0)
+        for tl, dl in zip(title_lines, detail_lines):
+            item_h = 18 + len(tl) * 14 + len(dl) * 11 + 14
+            y_pos.append(self.y - y_offset)
+            heights.append(item_h)
+            y_offset += item_h
 
-            self.text(timeline_x + 15, y_pos + 8, time, FONT, 8, color)
+        # 连线
+        self.c.setStrokeColor(BG)
+        self.c.setLineWidth(2)
+        for yp, item_h in zip(y_pos[:-1], heights):
+            self.c.line(timeline_x, yp - 5, timeline_x, yp - item_h + 5)
 
-            ty = y_pos - 5
-            for tl in title_lines:
-                self.text(timeline_x + 15, ty, tl, FONT_BOLD, 10, GRAY_DARK)
+        # 圆点 + 时间
+        self.c.setFont(FONT, 8)
+        for yp, time, color in zip(y_pos, times, colors):
+            self.c.setFillColor(color)
+            self.c.circle(timeline_x, yp, 5, fill=1, stroke=0)
+            self.c.drawString(text_x, yp + 8, time)
+
+        # 标题
+        self.c.setFont(FONT_BOLD, 10)
+        self.c.setFillColor(GRAY_DARK)
+        for yp, tl in zip(y_pos, title_lines):
+            ty = yp - 5
+            for line in tl:
+                self.c.drawString(text_x, ty, line)
                 ty -= 14
 
-            for dl in detail_lines:
-                self.text(timeline_x + 15, ty, dl, FONT, 8, GRAY_LIGHT)
+        # 详情 + 来源
+        self.c.setFont(FONT, 8)
+        self.c.setFillColor(GRAY_LIGHT)
+        for yp, tl, dl in zip(y_pos, title_lines, detail_lines):
+            ty = yp - 5 - len(tl) * 14
+            for line in dl:
+                self.c.drawString(text_x, ty, line)
                 ty -= 11
 
-            self.text(timeline_x + 15, ty, f"\u6765\u6e90: {source}", FONT, 7, GRAY_LIGHT)
-
-            # 画连线到下一个
-            if i < len(events) - 1:
-                self.c.setStrokeColor(BG)
-                self.c.setLineWidth(2)
-                self.c.line(timeline_x, y_pos - 5, timeline_x, y_pos - item_h + 5)
-
-            y_offset += item_h
+        self.c.setFont(FONT, 7)
+        for yp, tl, dl, source in zip(y_pos, title_lines, detail_lines, sources):
+            ty = yp - 5 - len(tl) * 14 - len(dl) * 11
+            self.c.drawString(text_x, ty, f"\u6765\u6e90: {source}")
 
         self.y -= y_offset + 15
 
@@ -241,6 +281,9 @@ class MBBReportEngine:
         """
         actions = [(priority_label, text, owner, deadline, color), ...]
         """
+        if not actions:
+            return
+
         for priority, action, owner, deadline, color in actions:
             self.c.setFillColor(color)
             self.c.roundRect(M, self.y - 16, 25, 16, 3, fill=1, stroke=0)
@@ -328,10 +371,8 @@ class MBBReportEngine:
         yc -= 18
         for ds in dimension_stats:
             # 优先级标签
-            priority_colors = {'high': CORAL, 'medium': ORANGE, 'low': GRAY_LIGHT}
-            priority_labels = {'high': '高', 'medium': '中', 'low': '低'}
-            p_color = priority_colors.get(ds['priority'], GRAY_LIGHT)
-            p_label = priority_labels.get(ds['priority'], '—')
+            p_color = PRIORITY_COLORS.get(ds['priority'], GRAY_LIGHT)
+            p_label = PRIORITY_LABELS_SHORT.get(ds['priority'], '—')
             self.c.setFillColor(p_color)
             self.c.roundRect(M + 15, yc - 3, 18, 14, 2, fill=1, stroke=0)
             self.text(M + 17, yc, p_label, FONT_BOLD, 8, WHITE)
@@ -376,24 +417,43 @@ class MBBReportEngine:
             except Exception:
                 return 0, 0
 
-        # 计算卡片高度
+        # 一次目录扫描得到已有文件名集合，替代逐张图片 os.path.exists
+        existing_imgs = set()
+        if images_base_dir and os.path.isdir(images_base_dir):
+            with os.scandir(images_base_dir) as it:
+                existing_imgs = {e.name for e in it}
+
+        def _image_exists(img_file):
+            # 含子目录的相对路径不在扫描结果中，退回单次 stat
+            # 集合未命中时同样退回 stat：macOS默认大小写不敏感（b.png 可找到 B.png），
+            # 文件名Unicode规范化形式也可能与扫描结果不同
+            if os.sep in img_file or '/' in img_file or img_file not in existing_imgs:
+                return os.path.exists(os.path.join(images_base_dir, img_file))
+            return True
+
+        # 计算卡片高度（同时缓存每条动态的换行结果和图片尺寸，绘制时直接复用）
         card_h = 35
+        layouts = []
         for entry in entries:
             detail_lines = self.wrap_text(entry.get('detail', ''), CW - 55, FONT, 8.5)
             entry_h = 22 + len(detail_lines) * 12 + 8
+            fb_lines = []
             if entry.get('player_feedback'):
                 fb_lines = self.wrap_text(entry['player_feedback'], CW - 70, FONT, 8)
                 entry_h += len(fb_lines) * 11 + 14
             if entry.get('source_title'):
                 entry_h += 14
             # 图片高度
+            images = []
             if images_base_dir and entry.get('images'):
                 for img in entry['images']:
                     if isinstance(img, dict) and img.get('file'):
-                        img_path = os.path.join(images_base_dir, img['file'])
-                        if os.path.exists(img_path):
-                            _, ih = _get_image_size(img_path)
+                        if _image_exists(img['file']):
+                            img_path = os.path.join(images_base_dir, img['file'])
+                            iw, ih = _get_image_size(img_path)
                             entry_h += ih + 8 + (12 if img.get('desc') else 0)
+                            images.append((img_path, iw, ih, img.get('desc', '')))
+            layouts.append((detail_lines, fb_lines, images))
             card_h += entry_h + 8
 
         # 卡片背景 + 左侧色条
@@ -406,21 +466,18 @@ class MBBReportEngine:
         self.text(M + 15, yc, dimension_name, FONT_BOLD, 13, NAVY)
 
         # 优先级标签
-        priority_colors = {'high': CORAL, 'medium': ORANGE, 'low': GRAY_LIGHT}
-        priority_labels = {'high': '高优先级', 'medium': '中优先级', 'low': '低优先级'}
-        p_color = priority_colors.get(priority_level, GRAY_LIGHT)
-        p_label = priority_labels.get(priority_level, '')
+        p_color = PRIORITY_COLORS.get(priority_level, GRAY_LIGHT)
+        p_label = PRIORITY_LABELS.get(priority_level, '')
         label_w = self.c.stringWidth(p_label, FONT_BOLD, 8) + 10
         self.c.setFillColor(p_color)
         self.c.roundRect(W - M - label_w - 10, yc - 3, label_w, 16, 3, fill=1, stroke=0)
         self.text(W - M - label_w - 5, yc, p_label, FONT_BOLD, 8, WHITE)
         yc -= 30
 
-        for entry in entries:
+        for entry, (detail_lines, fb_lines, images) in zip(entries, layouts):
             # Tier 标签 + 标题
             tier = entry.get('tier', 'T1')
-            tier_colors = {'T0': CORAL, 'T1': ORANGE, 'T2': GRAY_LIGHT}
-            t_color = tier_colors.get(tier, GRAY_LIGHT)
+            t_color = TIER_COLORS.get(tier, GRAY_LIGHT)
             self.c.setFillColor(t_color)
             self.c.roundRect(M + 15, yc - 2, 22, 14, 2, fill=1, stroke=0)
             self.text(M + 18, yc + 1, tier, FONT_BOLD, 8, WHITE)
@@ -434,7 +491,6 @@ class MBBReportEngine:
             yc -= 18
 
             # 详情
-            detail_lines = self.wrap_text(entry.get('detail', ''), CW - 55, FONT, 8.5)
             for dl in detail_lines:
                 yc -= 12
                 self.text(M + 20, yc, dl, FONT, 8.5, GRAY_DARK)
@@ -448,29 +504,22 @@ class MBBReportEngine:
             if entry.get('player_feedback'):
                 yc -= 14
                 self.text(M + 20, yc, "玩家反馈:", FONT_BOLD, 8, accent_color)
-                fb_lines = self.wrap_text(entry['player_feedback'], CW - 70, FONT, 8)
                 for fl in fb_lines:
                     yc -= 11
                     self.text(M + 30, yc, fl, FONT, 8, accent_color)
 
             # 图片嵌入
-            if images_base_dir and entry.get('images'):
-                for img in entry['images']:
-                    if isinstance(img, dict) and img.get('file'):
-                        img_path = os.path.join(images_base_dir, img['file'])
-                        if os.path.exists(img_path):
-                            iw, ih = _get_image_size(img_path)
-                            if iw > 0 and ih > 0:
-                                yc -= 8
-                                # 居中绘制图片
-                                img_x = M + 20 + (IMG_W - iw) / 2
-                                yc -= ih
-                                self.c.drawImage(img_path, img_x, yc, width=iw, height=ih, preserveAspectRatio=True)
-                                # 图片描述
-                                desc = img.get('desc', '')
-                                if desc:
-                                    yc -= 12
-                                    self.text(M + 20 + (IMG_W - self.c.stringWidth(desc, FONT, 7)) / 2, yc, desc, FONT, 7, GRAY_LIGHT)
+            for img_path, iw, ih, desc in images:
+                if iw > 0 and ih > 0:
+                    yc -= 8
+                    # 居中绘制图片
+                    img_x = M + 20 + (IMG_W - iw) / 2
+                    yc -= ih
+                    self.c.drawImage(img_path, img_x, yc, width=iw, height=ih, preserveAspectRatio=True)
+                    # 图片描述
+                    if desc:
+                        yc -= 12
+                        self.text(M + 20 + (IMG_W - self.c.stringWidth(desc, FONT, 7)) / 2, yc, desc, FONT, 7, GRAY_LIGHT)
 
             yc -= 16
 
@@ -478,23 +527,27 @@ class MBBReportEngine:
 
     def save(self):
         self.c.save()
-        # 裁剪页面：用 pypdf 去除尾部空白
+        pdf_bytes = self._buf.getvalue()
+        msg = f"\u2705 \u62a5\u544a\u5df2\u751f\u6210: {self.filename}"
+        # 裁剪页面：用 pypdf 去除尾部空白（在内存中完成，避免写盘后再读回）
         actual_h = self.H - self.y + M + 30
         if actual_h < self.H:
             try:
                 from pypdf import PdfReader, PdfWriter
                 offset = self.H - actual_h
-                reader = PdfReader(self.filename)
+                reader = PdfReader(io.BytesIO(pdf_bytes))
                 writer = PdfWriter()
                 page = reader.pages[0]
                 # MediaBox 坐标系：[左, 下, 右, 上]，裁掉底部空白区域
                 mb = page.mediabox
                 page.mediabox.lower_left = (float(mb.left), float(mb.bottom) + offset)
                 writer.add_page(page)
-                with open(self.filename, 'wb') as f:
-                    writer.write(f)
-                print(f"\u2705 \u62a5\u544a\u5df2\u751f\u6210: {self.filename}\uff08\u5df2\u88c1\u526a\u7a7a\u767d\uff09")
-                return
+                out = io.BytesIO()
+                writer.write(out)
+                pdf_bytes = out.getvalue()
+                msg += "\uff08\u5df2\u88c1\u526a\u7a7a\u767d\uff09"
             except Exception as e:
                 print(f"\u26a0\ufe0f \u88c1\u526a\u5931\u8d25: {e}\uff0c\u4fdd\u7559\u539f\u59cb\u6587\u4ef6")
-        print(f"\u2705 \u62a5\u544a\u5df2\u751f\u6210: {self.filename}")
+        with open(self.filename, 'wb') as f:
+            f.write(pdf_bytes)
+        print(msg)